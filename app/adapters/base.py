@@ -6,13 +6,31 @@ must implement. It ensures consistency across different platforms and makes
 it easy to add new data sources.
 """
 
+import re
+import asyncio
+import contextvars
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Sequence, Set
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 
+import aiohttp
+import numpy as np
 
-@dataclass
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+# ASCII-only variants skip the Unicode \w tables; identical on ASCII text
+_HASHTAG_ASCII_RE = re.compile(r'#(\w+)', re.ASCII)
+_MENTION_ASCII_RE = re.compile(r'@(\w+)', re.ASCII)
+# Depth of `async with adapter:` blocks in the current task; tasks spawned
+# inside a block (gather etc.) inherit it
+_session_scope_depth = contextvars.ContextVar("session_scope_depth", default=0)
+
+_URL_RE = re.compile(r"https?://[\w!$%&'()*+,\-./:;<=>?@\[\\\]^]+", re.ASCII)
+
+
+@dataclass(slots=True)
 class SocialPost:
     """
     Standardized social media post structure.
@@ -28,18 +46,52 @@ class SocialPost:
     retweets: int = 0
     replies: int = 0
     language: Optional[str] = None
-    hashtags: List[str] = None
-    mentions: List[str] = None
-    urls: List[str] = None
+    hashtags: List[str] = field(default_factory=list)
+    mentions: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
     raw_data: Optional[Dict[str, Any]] = None  # Original platform data
+
+
+# Columns produced by posts_to_columns(), in SocialPost field order
+COLUMN_FIELDS = (
+    "id", "text", "author_id", "author_username", "created_at",
+    "likes", "retweets", "replies", "language", "hashtags", "mentions", "urls",
+)
+_COUNT_FIELDS = frozenset(("likes", "retweets", "replies"))
+
+
+def posts_to_columns(
+    posts: List[SocialPost],
+    fields: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Convert a list of posts into a structure of arrays.
+    
+    Analytics passes only need a few fields (usually just ``text``), so
+    callers should ask for just those; each column costs one pass over the
+    posts. Engagement counts are returned as int64 NumPy arrays, with
+    missing (None) counts stored as 0.
+    
+    Args:
+        posts: Standardized SocialPost objects
+        fields: Columns to build (default: all of COLUMN_FIELDS)
+        
+    Returns:
+        Dict mapping each requested field to its column
+    """
+    count = len(posts)
+    columns = {}
     
-    def __post_init__(self):
-        if self.hashtags is None:
-            self.hashtags = []
-        if self.mentions is None:
-            self.mentions = []
-        if self.urls is None:
-            self.urls = []
+    for name in fields or COLUMN_FIELDS:
+        values = map(attrgetter(name), posts)
+        if name in _COUNT_FIELDS:
+            columns[name] = np.fromiter(
+                (value or 0 for value in values), dtype=np.int64, count=count
+            )
+        else:
+            columns[name] = list(values)
+    
+    return columns
 
 
 class SocialMediaAdapter(ABC):
@@ -50,6 +102,14 @@ class SocialMediaAdapter(ABC):
     interface to provide a consistent way to fetch and process posts.
     """
     
+    # HTTP sessions shared by every adapter, one per event loop, see get_session()
+    _sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+    # Loops whose session has also been used outside any `async with adapter:`
+    # block (e.g. the worker's persistent loop); only close_session() closes those
+    _pinned_loops: Set[asyncio.AbstractEventLoop] = set()
+    # Number of `async with adapter:` blocks currently open on each loop
+    _scope_counts: Dict[asyncio.AbstractEventLoop, int] = {}
+    
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """
         Initialize the adapter with authentication credentials.
@@ -61,6 +121,86 @@ class SocialMediaAdapter(ABC):
         self.api_key = api_key
         self.config = kwargs
     
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session shared by all adapters on the running event loop.
+        
+        The session is created lazily and reused across calls, so keep-alive
+        connections, DNS lookups and TLS sessions carry over between requests.
+        aiohttp sessions are bound to the event loop that created them, so each
+        loop gets its own session.
+        
+        Returns:
+            Shared aiohttp.ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        sessions = SocialMediaAdapter._sessions
+        session = sessions.get(loop)
+        
+        if not _session_scope_depth.get():
+            SocialMediaAdapter._pinned_loops.add(loop)
+        
+        if session is None or session.closed:
+            # Drop sessions left behind by loops that have since closed, so
+            # they (and their loops) don't stay referenced for the process
+            # lifetime
+            for dead_loop in [l for l in sessions if l.is_closed()]:
+                del sessions[dead_loop]
+                SocialMediaAdapter._pinned_loops.discard(dead_loop)
+            
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+            sessions[loop] = session
+        
+        return session
+    
+    @classmethod
+    async def close_session(cls):
+        """
+        Close the running event loop's shared HTTP session, if one is open.
+        """
+        loop = asyncio.get_running_loop()
+        session = SocialMediaAdapter._sessions.pop(loop, None)
+        SocialMediaAdapter._pinned_loops.discard(loop)
+        
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        counts = SocialMediaAdapter._scope_counts
+        counts[loop] = counts.get(loop, 0) + 1
+        _session_scope_depth.set(_session_scope_depth.get() + 1)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        Close the shared HTTP session on exit, if nothing else still uses it.
+        
+        For one-off callers that run under their own asyncio.run(), e.g.
+        ``async with get_adapter('twitter') as adapter: ...``. The session is
+        left open while other blocks on the loop are still open, or if it has
+        been used outside any block (long-lived workers, which close it at
+        shutdown instead).
+        """
+        loop = asyncio.get_running_loop()
+        counts = SocialMediaAdapter._scope_counts
+        _session_scope_depth.set(_session_scope_depth.get() - 1)
+        
+        counts[loop] -= 1
+        if counts[loop]:
+            return
+        del counts[loop]
+        
+        if loop not in SocialMediaAdapter._pinned_loops:
+            await self.close_session()
+    
     @abstractmethod
     async def fetch_posts(
         self,
@@ -83,6 +223,28 @@ class SocialMediaAdapter(ABC):
         """
         pass
     
+    async def fetch_posts_soa(
+        self,
+        query: str,
+        max_results: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Fetch posts as columns instead of SocialPost objects.
+        
+        Args:
+            query: Search query (topic, hashtag, keyword, etc.)
+            max_results: Maximum number of posts to fetch
+            fields: Columns to build (default: all of COLUMN_FIELDS)
+            **kwargs: Passed through to fetch_posts()
+            
+        Returns:
+            Column dict as produced by posts_to_columns()
+        """
+        posts = await self.fetch_posts(query, max_results=max_results, **kwargs)
+        return posts_to_columns(posts, fields)
+    
     @abstractmethod
     def normalize_post(self, raw_post: Dict[str, Any]) -> SocialPost:
         """
@@ -116,8 +278,8 @@ class SocialMediaAdapter(ABC):
         Returns:
             List of hashtags (without # symbol)
         """
-        import re
-        return [tag.lower() for tag in re.findall(r'#(\w+)', text)]
+        pattern = _HASHTAG_ASCII_RE if text.isascii() else _HASHTAG_RE
+        return [tag.lower() for tag in pattern.findall(text)]
     
     def extract_mentions(self, text: str) -> List[str]:
         """
@@ -129,8 +291,8 @@ class SocialMediaAdapter(ABC):
         Returns:
             List of mentioned usernames (without @ symbol)
         """
-        import re
-        return [mention.lower() for mention in re.findall(r'@(\w+)', text)]
+        pattern = _MENTION_ASCII_RE if text.isascii() else _MENTION_RE
+        return [mention.lower() for mention in pattern.findall(text)]
     
     def extract_urls(self, text: str) -> List[str]:
         """
@@ -142,9 +304,7 @@ class SocialMediaAdapter(ABC):
         Returns:
             List of URLs
         """
-        import re
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        return re.findall(url_pattern, text)
+        return _URL_RE.findall(text)
     
     @property
     @abstractmethod
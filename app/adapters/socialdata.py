@@ -4,12 +4,51 @@ Provides a high-quality, cost-effective alternative to the official X API.
 """
 
 import os
-import json
+import logging
 from typing import List, Dict, Any, Optional
-from datetime import datetime
-import aiohttp
+from datetime import datetime, timedelta, timezone
+import orjson
 from app.adapters.base import SocialMediaAdapter, SocialPost
 
+logger = logging.getLogger(__name__)
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+_TWITTER_DT_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+
+def _parse_twitter_dt(value: str) -> datetime:
+    """
+    Parse Twitter's legacy timestamp format, e.g. "Wed Oct 10 20:19:24 +0000 2018".
+    
+    Slices the fixed-width fields directly instead of going through strptime,
+    falling back to strptime for anything that doesn't match the layout.
+    """
+    try:
+        if len(value) != 30:
+            raise ValueError(value)
+        
+        offset = int(value[21:23]) * 60 + int(value[23:25])
+        if value[20] == "-":
+            offset = -offset
+        elif value[20] != "+":
+            raise ValueError(value)
+        
+        return datetime(
+            int(value[26:30]),
+            _MONTHS[value[4:7]],
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=timezone.utc if offset == 0 else timezone(timedelta(minutes=offset)),
+        )
+    except (KeyError, ValueError, IndexError):
+        return datetime.strptime(value, _TWITTER_DT_FORMAT)
+
 class SocialDataAdapter(SocialMediaAdapter):
     """
     Adapter for SocialData.tools API.
@@ -31,7 +70,7 @@ class SocialDataAdapter(SocialMediaAdapter):
         Fetch real tweets via SocialData.tools.
         """
         if not self.api_key or self.api_key == "your_socialdata_key_here":
-            print("⚠️ SocialData API Key missing. Skipping...")
+            logger.warning("SocialData API Key missing. Skipping...")
             return []
 
         # The base URL is https://api.socialdata.tools
@@ -50,45 +89,48 @@ class SocialDataAdapter(SocialMediaAdapter):
             "type": "Latest"
         }
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers, params=params) as response:
-                    status = response.status
-                    text = await response.text()
-                    
-                    if status == 200:
-                        data = json.loads(text)
-                        # SocialData returns a 'tweets' array
-                        raw_tweets = data.get("tweets", [])
-                        print(f"✅ SocialData: Successfully fetched {len(raw_tweets)} tweets for '{query}'")
-                        return [self.normalize_post(t) for t in raw_tweets[:max_results]]
-                    elif "Deprecated" in text:
-                        print(f"❌ SocialData API Error: Endpoint '{url}' is deprecated. Please check for a new endpoint in the dashboard.")
-                        return []
-                    else:
-                        print(f"❌ SocialData API Error: {status} - {text}")
-                        return []
-            except Exception as e:
-                print(f"❌ SocialData Exception: {str(e)}")
-                return []
+        session = self.get_session()
+        try:
+            async with session.get(url, headers=headers, params=params) as response:
+                status = response.status
+                body = await response.read()
+                
+                if status == 200:
+                    data = orjson.loads(body)
+                    # SocialData returns a 'tweets' array
+                    raw_tweets = data.get("tweets", [])
+                    logger.info("SocialData: Successfully fetched %d tweets for '%s'", len(raw_tweets), query)
+                    return [self.normalize_post(t) for t in raw_tweets[:max_results]]
+                elif b"Deprecated" in body:
+                    logger.error("SocialData API Error: Endpoint '%s' is deprecated. Please check for a new endpoint in the dashboard.", url)
+                    return []
+                else:
+                    logger.error("SocialData API Error: %s - %s", status, body.decode(errors='replace'))
+                    return []
+        except Exception as e:
+            logger.error("SocialData Exception: %s", e)
+            return []
 
     def normalize_post(self, raw_post: Dict[str, Any]) -> SocialPost:
         """
         Maps SocialData.tools JSON structure to our standard SocialPost
         """
-        user = raw_post.get("user", {})
+        # Bind the lookups once; this runs for every tweet in a page
+        get = raw_post.get
+        user_get = get("user", {}).get
         
         return SocialPost(
-            id=str(raw_post.get("id_str")),
-            text=raw_post.get("full_text") or raw_post.get("text", ""),
-            author_id=str(user.get("id_str")),
-            author_username=user.get("screen_name", "unknown"),
-            created_at=datetime.strptime(raw_post["created_at"], "%a %b %d %H:%M:%S %z %Y"),
-            likes=raw_post.get("favorite_count", 0),
-            retweets=raw_post.get("retweet_count", 0),
-            replies=raw_post.get("reply_count", 0),
-            language=raw_post.get("lang"),
-            hashtags=[h["text"] for h in raw_post.get("entities", {}).get("hashtags", [])],
+            id=str(get("id_str")),
+            text=get("full_text") or get("text", ""),
+            author_id=str(user_get("id_str")),
+            author_username=user_get("screen_name", "unknown"),
+            created_at=_parse_twitter_dt(raw_post["created_at"]),
+            # Counts can be null in the payload
+            likes=get("favorite_count") or 0,
+            retweets=get("retweet_count") or 0,
+            replies=get("reply_count") or 0,
+            language=get("lang"),
+            hashtags=[h["text"] for h in get("entities", {}).get("hashtags", [])],
             raw_data=raw_post
         )
 
@@ -6,12 +6,16 @@ allowing seamless integration with the Twitter API v2.
 """
 
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import functools
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
 import asyncio
 
 from app.adapters.base import SocialMediaAdapter, SocialPost
 
+logger = logging.getLogger(__name__)
+
 
 class TwitterAdapter(SocialMediaAdapter):
     """
@@ -81,7 +85,7 @@ class TwitterAdapter(SocialMediaAdapter):
                 
                 # Check for errors in response
                 if "errors" in response and not "data" in response:
-                    print(f"⚠️ Twitter API Error: {response['errors']}")
+                    logger.warning("Twitter API Error: %s", response['errors'])
                     return await self._fetch_mock_posts(query, max_results)
 
                 # Normalize posts
@@ -94,7 +98,7 @@ class TwitterAdapter(SocialMediaAdapter):
                 
                 return posts
             except Exception as e:
-                print(f"⚠️ API Request failed ({e}), falling back to mock data.")
+                logger.warning("API Request failed (%s), falling back to mock data.", e)
                 return await self._fetch_mock_posts(query, max_results)
         
         # Fallback to mock data if no token
@@ -106,30 +110,37 @@ class TwitterAdapter(SocialMediaAdapter):
         
         In production, replace this with actual Twitter API calls.
         """
+        # Every mock text is one of three fixed sentences around the query,
+        # ending in "#<i>", so the entity extraction only depends on the query.
+        templates = (
+            f"{query} is amazing for developers #",
+            f"I am unsure about {query} future #",
+            f"{query} is overhyped and risky #",
+        )
+        query_hashtags = self.extract_hashtags(query)
+        query_mentions = self.extract_mentions(query)
+        query_urls = self.extract_urls(query)
+        
+        # Real API timestamps are timezone-aware, so mock ones are too
+        now = datetime.now(timezone.utc)
         posts = []
         
         for i in range(min(max_results, 120)):
-            # Simulate different sentiment patterns
-            if i % 3 == 0:
-                text = f"{query} is amazing for developers #{i}"
-            elif i % 3 == 1:
-                text = f"I am unsure about {query} future #{i}"
-            else:
-                text = f"{query} is overhyped and risky #{i}"
+            n = str(i)
             
             post = SocialPost(
-                id=f"tweet_{i}",
-                text=text,
+                id=f"tweet_{n}",
+                text=templates[i % 3] + n,
                 author_id=f"user_{i % 10}",
                 author_username=f"user{i % 10}",
-                created_at=datetime.now(),
+                created_at=now,
                 likes=int(100 * (1 - i / max_results)),
                 retweets=int(50 * (1 - i / max_results)),
                 replies=int(20 * (1 - i / max_results)),
                 language="en",
-                hashtags=self.extract_hashtags(text),
-                mentions=self.extract_mentions(text),
-                urls=self.extract_urls(text)
+                hashtags=query_hashtags + [n],
+                mentions=list(query_mentions),
+                urls=list(query_urls)
             )
             
             posts.append(post)
@@ -148,8 +159,6 @@ class TwitterAdapter(SocialMediaAdapter):
         
         This is a template for real API integration.
         """
-        import aiohttp
-        
         headers = {
             "Authorization": f"Bearer {self.bearer_token}",
             "Content-Type": "application/json"
@@ -168,16 +177,16 @@ class TwitterAdapter(SocialMediaAdapter):
         if end_time:
             params["end_time"] = end_time.isoformat() + "Z"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self.search_endpoint,
-                headers=headers,
-                params=params
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise Exception(f"Twitter API error: {response.status}")
+        session = self.get_session()
+        async with session.get(
+            self.search_endpoint,
+            headers=headers,
+            params=params
+        ) as response:
+            if response.status == 200:
+                return await response.json()
+            else:
+                raise Exception(f"Twitter API error: {response.status}")
     
     def normalize_post(self, raw_post: Dict[str, Any]) -> SocialPost:
         """
@@ -208,40 +217,43 @@ class TwitterAdapter(SocialMediaAdapter):
                 }
             }
         """
-        text = raw_post.get("text", "")
-        metrics = raw_post.get("public_metrics", {})
-        entities = raw_post.get("entities", {})
+        # Bind the lookups once; this runs for every tweet in a page
+        get = raw_post.get
+        metrics_get = get("public_metrics", {}).get
+        entities_get = get("entities", {}).get
         
         # Extract hashtags
         hashtags = [
             tag["tag"].lower()
-            for tag in entities.get("hashtags", [])
+            for tag in entities_get("hashtags", [])
         ]
         
         # Extract mentions
         mentions = [
             mention["username"].lower()
-            for mention in entities.get("mentions", [])
+            for mention in entities_get("mentions", [])
         ]
         
         # Extract URLs
         urls = [
             url.get("expanded_url", url.get("url", ""))
-            for url in entities.get("urls", [])
+            for url in entities_get("urls", [])
         ]
         
+        created_at = raw_post["created_at"]
+        if created_at.endswith("Z"):
+            created_at = created_at[:-1] + "+00:00"
+        
         return SocialPost(
             id=raw_post["id"],
-            text=text,
-            author_id=raw_post.get("author_id", ""),
-            author_username=raw_post.get("username", "unknown"),
-            created_at=datetime.fromisoformat(
-                raw_post["created_at"].replace("Z", "+00:00")
-            ),
-            likes=metrics.get("like_count", 0),
-            retweets=metrics.get("retweet_count", 0),
-            replies=metrics.get("reply_count", 0),
-            language=raw_post.get("lang"),
+            text=get("text", ""),
+            author_id=get("author_id", ""),
+            author_username=get("username", "unknown"),
+            created_at=datetime.fromisoformat(created_at),
+            likes=metrics_get("like_count") or 0,
+            retweets=metrics_get("retweet_count") or 0,
+            replies=metrics_get("reply_count") or 0,
+            language=get("lang"),
             hashtags=hashtags,
             mentions=mentions,
             urls=urls,
@@ -300,29 +312,45 @@ class TwitterAdapter(SocialMediaAdapter):
             )
             # Returns: "(AI OR machine learning) #tech -is:retweet lang:en"
         """
-        query_parts = []
-        
-        # Add keywords
-        if keywords:
-            keywords_query = " OR ".join(keywords)
-            query_parts.append(f"({keywords_query})")
-        
-        # Add hashtags
-        if hashtags:
-            for tag in hashtags:
-                query_parts.append(f"#{tag}")
-        
-        # Add mentions
-        if mentions:
-            for mention in mentions:
-                query_parts.append(f"@{mention}")
-        
-        # Exclude retweets
-        if exclude_retweets:
-            query_parts.append("-is:retweet")
-        
-        # Add language filter
-        if language:
-            query_parts.append(f"lang:{language}")
-        
-        return " ".join(query_parts)
+        return _build_query_cached(
+            tuple(keywords or ()),
+            tuple(hashtags or ()),
+            tuple(mentions or ()),
+            exclude_retweets,
+            language
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_query_cached(
+    keywords: Tuple[str, ...],
+    hashtags: Tuple[str, ...],
+    mentions: Tuple[str, ...],
+    exclude_retweets: bool,
+    language: Optional[str]
+) -> str:
+    """Memoized implementation of TwitterAdapter.build_query()."""
+    query_parts = []
+    
+    # Add keywords
+    if keywords:
+        keywords_query = " OR ".join(keywords)
+        query_parts.append(f"({keywords_query})")
+    
+    # Add hashtags
+    for tag in hashtags:
+        query_parts.append(f"#{tag}")
+    
+    # Add mentions
+    for mention in mentions:
+        query_parts.append(f"@{mention}")
+    
+    # Exclude retweets
+    if exclude_retweets:
+        query_parts.append("-is:retweet")
+    
+    # Add language filter
+    if language:
+        query_parts.append(f"lang:{language}")
+    
+    return " ".join(query_parts)
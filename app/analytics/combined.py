@@ -0,0 +1,56 @@
+from collections import Counter
+from heapq import nlargest
+from itertools import filterfalse
+from operator import itemgetter
+
+import numpy as np
+
+from app.analytics.sentiment import score_texts
+from app.analytics.words import STOPWORDS, TOKEN_RE
+
+def analyze_topics(post_lists, top_n=50):
+    """
+    post_lists: list[list[str]], one list of texts per topic
+    returns: list of dicts, one per topic, with "sentiment" counts and
+    "top_words", equivalent to analyze_sentiments() and
+    extract_word_frequencies() per topic but computed in a single walk over
+    the texts, with every topic's distinct texts scored in one batch
+    """
+    findall = TOKEN_RE.findall
+    is_stopword = STOPWORDS.__contains__
+
+    # Same dedup as score_batch(): each text gets the id of its first
+    # occurrence, and scores are gathered by id
+    text_ids = {}
+    assign_id = text_ids.setdefault
+    ids = []
+    top_words = []
+
+    for texts in post_lists:
+        counter = Counter()
+        for text in texts:
+            ids.append(assign_id(text, len(text_ids)))
+            counter.update(filterfalse(is_stopword, findall(text.lower())))
+        top_words.append(nlargest(top_n, counter.items(), key=itemgetter(1)))
+
+    scores = score_texts(text_ids)[np.array(ids, dtype=np.intp)]
+
+    topic_count = len(post_lists)
+    lengths = np.fromiter(map(len, post_lists), dtype=np.intp, count=topic_count)
+    topic_ids = np.repeat(np.arange(topic_count), lengths)
+    positive = np.bincount(topic_ids[scores >= 0.05], minlength=topic_count)
+    negative = np.bincount(topic_ids[scores <= -0.05], minlength=topic_count)
+
+    results = []
+    for i, texts in enumerate(post_lists):
+        pos, neg = int(positive[i]), int(negative[i])
+        results.append({
+            "sentiment": {
+                "positive": pos,
+                "neutral": len(texts) - pos - neg,
+                "negative": neg,
+            },
+            "top_words": top_words[i],
+        })
+
+    return results
@@ -1,21 +1,53 @@
+import numpy as np
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 analyzer = SentimentIntensityAnalyzer()
 
-def analyze_sentiments(texts):
+def score_batch(texts):
     """
     texts: list[str]
+    returns: np.ndarray[float32] of compound scores, one per text
+    """
+    # Repeated texts (retweets, copy-paste spam) are scored once; each text
+    # gets the id of its first occurrence and scores are gathered by id
+    text_ids = {}
+    ids = np.fromiter(
+        (text_ids.setdefault(text, len(text_ids)) for text in texts),
+        dtype=np.intp,
+        count=len(texts),
+    )
+
+    return score_texts(text_ids)[ids]
+
+def score_texts(texts):
+    """
+    texts: sized iterable of str (score_batch passes distinct texts)
+    returns: np.ndarray[float32] of compound scores, one per text
+    """
+    polarity_scores = analyzer.polarity_scores
+    return np.fromiter(
+        (polarity_scores(text)["compound"] for text in texts),
+        dtype=np.float32,
+        count=len(texts),
+    )
+
+def count_sentiments(scores):
+    """
+    scores: np.ndarray of compound scores
     returns: dict with sentiment counts
     """
-    result = {"positive": 0, "neutral": 0, "negative": 0}
+    positive = int((scores >= 0.05).sum())
+    negative = int((scores <= -0.05).sum())
 
-    for text in texts:
-        score = analyzer.polarity_scores(text)["compound"]
-        if score >= 0.05:
-            result["positive"] += 1
-        elif score <= -0.05:
-            result["negative"] += 1
-        else:
-            result["neutral"] += 1
+    return {
+        "positive": positive,
+        "neutral": len(scores) - positive - negative,
+        "negative": negative,
+    }
 
-    return result
+def analyze_sentiments(texts):
+    """
+    texts: list[str]
+    returns: dict with sentiment counts
+    """
+    return count_sentiments(score_batch(texts))
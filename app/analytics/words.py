@@ -1,16 +1,29 @@
 import re
+import sys
 from collections import Counter
+from heapq import nlargest
+from itertools import filterfalse
+from operator import itemgetter
 
-STOPWORDS = {
+STOPWORDS = frozenset(map(sys.intern, {
     "the", "is", "and", "to", "of", "in", "for", "on",
     "with", "a", "an", "this", "that", "it", "as", "are"
-}
+}))
+
+try:
+    # Optional DFA-based engine (google-re2 / pyre2); same API for this pattern
+    import re2 as _token_regex
+except ImportError:
+    _token_regex = re
+
+TOKEN_RE = _token_regex.compile(r"[a-zA-Z]{3,}")
 
 def extract_word_frequencies(texts, top_n=50):
-    words = []
+    # Tokens never span a newline, so one scan over the joined corpus
+    # yields the same tokens as scanning each text separately.
+    tokens = TOKEN_RE.findall("\n".join(texts).lower())
 
-    for text in texts:
-        tokens = re.findall(r"[a-zA-Z]{3,}", text.lower())
-        words.extend([t for t in tokens if t not in STOPWORDS])
+    # filterfalse + the set's own __contains__ keeps filtering in C
+    counter = Counter(filterfalse(STOPWORDS.__contains__, tokens))
 
-    return Counter(words).most_common(top_n)
+    return nlargest(top_n, counter.items(), key=itemgetter(1))
@@ -1,14 +1,16 @@
 import time
-import json
 import uuid
 
+from cachetools import TTLCache
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from app.cache.redis_client import redis_client
-from app.cache.cache_utils import make_cache_key
-from app.workers.tasks import process_batch
-from app.metrics.metrics import incr
+from starlette.concurrency import run_in_threadpool
+from app.cache.redis_client import async_redis_client
+from app.cache.cache_utils import decode_result, make_cache_key
+from app.workers.tasks import process_batch, encode_queue_entry, BATCH_SIZE
+from app.metrics.metrics import incr_async, get_many_async
 
 app = FastAPI()
 
@@ -26,36 +28,49 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 BATCH_QUEUE_KEY = "analysis_batch_queue"
 
+# Process-local copy of recently served results, checked before Redis
+local_cache = TTLCache(maxsize=4096, ttl=60)
+
 
 @app.post("/analyze")
-def analyze(payload: dict):
+async def analyze(payload: dict):
     start_time = time.time()
 
     cache_key = make_cache_key(payload)
-    cached = redis_client.get(cache_key)
+    result = local_cache.get(cache_key)
 
-    if cached:
-        incr("metrics:cache_hits")
+    if result is None:
+        cached = await async_redis_client.get(cache_key)
+        if cached:
+            result = decode_result(cached)
+            local_cache[cache_key] = result
+
+    if result is not None:
+        await incr_async("metrics:cache_hits")
 
         latency_ms = int((time.time() - start_time) * 1000)
         return {
             "status": "cached",
             "latency_ms": latency_ms,
-            "result": json.loads(cached),
+            "result": result,
         }
 
-    incr("metrics:cache_misses")
-
     request_id = str(uuid.uuid4())
-    redis_client.rpush(
-        BATCH_QUEUE_KEY,
-        json.dumps({"request_id": request_id, "payload": payload}),
-    )
-
-    incr("metrics:tasks_enqueued")
 
-    if redis_client.llen(BATCH_QUEUE_KEY) >= 5:
-        process_batch.delay()
+    # Enqueue and record metrics in a single round-trip. RPUSH returns the
+    # new queue length atomically, so exactly one request sees each full batch.
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        pipe.rpush(
+            BATCH_QUEUE_KEY,
+            encode_queue_entry({"request_id": request_id, "payload": payload}),
+        )
+        pipe.incrby("metrics:tasks_enqueued", 1)
+        pipe.incrby("metrics:cache_misses", 1)
+        queue_len, _, _ = await pipe.execute()
+
+    if queue_len % BATCH_SIZE == 0:
+        # Publishing to the broker is blocking I/O
+        await run_in_threadpool(process_batch.delay)
 
     latency_ms = int((time.time() - start_time) * 1000)
     return {
@@ -64,16 +79,26 @@ def analyze(payload: dict):
         "latency_ms": latency_ms,
     }
 
-from app.metrics.metrics import get
 
 @app.get("/metrics")
-def metrics():
+async def metrics():
+    (
+        cache_hits,
+        cache_misses,
+        tasks_enqueued,
+        batches_processed,
+        batch_size_total,
+    ) = await get_many_async(
+        "metrics:cache_hits",
+        "metrics:cache_misses",
+        "metrics:tasks_enqueued",
+        "metrics:batches_processed",
+        "metrics:batch_size_total",
+    )
     return {
-        "cache_hits": get("metrics:cache_hits"),
-        "cache_misses": get("metrics:cache_misses"),
-        "tasks_enqueued": get("metrics:tasks_enqueued"),
-        "batches_processed": get("metrics:batches_processed"),
-        "avg_batch_size": (
-            get("metrics:batch_size_total") / max(get("metrics:batches_processed"), 1)
-        ),
+        "cache_hits": cache_hits,
+        "cache_misses": cache_misses,
+        "tasks_enqueued": tasks_enqueued,
+        "batches_processed": batches_processed,
+        "avg_batch_size": batch_size_total / max(batches_processed, 1),
     }
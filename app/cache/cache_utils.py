@@ -1,7 +1,36 @@
-import json
+import base64
 import hashlib
+import json
+
+import orjson
 
 def make_cache_key(payload: dict) -> str:
-    payload_str = json.dumps(payload, sort_keys=True)
-    payload_hash = hashlib.sha256(payload_str.encode()).hexdigest()
+    try:
+        payload_bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # orjson rejects integers outside the 64-bit range and strings with
+        # lone surrogates; json escapes both
+        payload_bytes = json.dumps(
+            payload, sort_keys=True, separators=(",", ":")
+        ).encode()
+    digest = hashlib.blake2b(payload_bytes, digest_size=16).digest()
+    # base64url without padding: 22 chars instead of 32 hex chars
+    payload_hash = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
     return f"analysis:{payload_hash}"
+
+
+def encode_result(result: dict) -> bytes:
+    try:
+        return orjson.dumps(result)
+    except TypeError:
+        # orjson rejects lone surrogates (e.g. in the topic); json escapes them
+        return json.dumps(result, separators=(",", ":")).encode()
+
+
+def decode_result(value) -> dict:
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # encode_result()'s json fallback can escape lone surrogates, which
+        # orjson refuses to read
+        return json.loads(value)
@@ -1,4 +1,5 @@
 import redis
+import redis.asyncio
 from app.config import REDIS_HOST, REDIS_PORT
 
 redis_client = redis.Redis(
@@ -6,3 +7,17 @@ redis_client = redis.Redis(
     port=int(REDIS_PORT),
     decode_responses=True,
 )
+
+# Used by the async paths (FastAPI endpoints, batch pipeline)
+async_redis_client = redis.asyncio.Redis(
+    host=REDIS_HOST,
+    port=int(REDIS_PORT),
+    decode_responses=True,
+)
+
+# Returns raw bytes, for binary (msgpack) values such as batch queue entries
+async_redis_raw_client = redis.asyncio.Redis(
+    host=REDIS_HOST,
+    port=int(REDIS_PORT),
+    decode_responses=False,
+)
@@ -1,4 +1,4 @@
-from app.cache.redis_client import redis_client
+from app.cache.redis_client import redis_client, async_redis_client
 
 def incr(key: str, amount: int = 1):
     redis_client.incrby(key, amount)
@@ -6,3 +6,10 @@ def incr(key: str, amount: int = 1):
 def get(key: str) -> int:
     val = redis_client.get(key)
     return int(val) if val else 0
+
+async def incr_async(key: str, amount: int = 1):
+    await async_redis_client.incrby(key, amount)
+
+async def get_many_async(*keys: str) -> list:
+    vals = await async_redis_client.mget(keys)
+    return [int(val) if val else 0 for val in vals]
@@ -0,0 +1,35 @@
+"""
+asyncio-native worker for the batch pipeline, built on arq.
+
+Runs the same run_batch() coroutine as the Celery task, but as a plain
+coroutine on arq's event loop, so many batches can be in flight per
+process without a prefork pool or a sync-to-async bridge. Both workers
+drain the same Redis queue (the pops are atomic), so they can run side by
+side during a migration.
+
+Start with:
+    arq app.workers.arq_worker.WorkerSettings
+"""
+
+from arq import cron
+from arq.connections import RedisSettings
+
+from app.config import REDIS_HOST, REDIS_PORT
+from app.adapters.base import SocialMediaAdapter
+from app.workers.tasks import run_batch
+
+
+async def process_batch(ctx):
+    return await run_batch()
+
+
+async def shutdown(ctx):
+    await SocialMediaAdapter.close_session()
+
+
+class WorkerSettings:
+    functions = [process_batch]
+    # Same cadence as the Celery beat schedule
+    cron_jobs = [cron(process_batch, second=set(range(0, 60, 3)))]
+    on_shutdown = shutdown
+    redis_settings = RedisSettings(host=REDIS_HOST, port=int(REDIS_PORT))
@@ -1,5 +1,10 @@
+import asyncio
+import threading
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 from app.config import REDIS_URL
+from app.adapters.base import SocialMediaAdapter
 
 celery_app = Celery(
     "async_social_analytics",
@@ -14,6 +19,12 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # process_batch is I/O-bound, so workers run with a gevent pool (see
+    # TWITTER_INTEGRATION.md); don't reserve more tasks than green threads
+    worker_prefetch_multiplier=1,
+    # Tasks log through logging; stray prints shouldn't go through the
+    # redirected-stdout logger proxy
+    worker_redirect_stdouts=False,
     beat_schedule={
         "process-batch-every-3-seconds": {
             "task": "app.workers.tasks.process_batch",
@@ -21,3 +32,53 @@ celery_app.conf.update(
         },
     },
 )
+
+# One event loop per worker process, kept alive across tasks so the adapters'
+# shared HTTP session and its keep-alive connections survive between batches.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="worker-event-loop",
+                daemon=True,
+            ).start()
+        return _loop
+
+
+@worker_process_init.connect
+def _start_event_loop(**kwargs):
+    # Start the loop as each prefork child boots (after the fork, so the
+    # thread belongs to the child); other pools start it on first use
+    _get_loop()
+
+
+def run_async(coro):
+    """Run a coroutine on the worker's event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _close_event_loop(**kwargs):
+    global _loop
+
+    with _loop_lock:
+        loop, _loop = _loop, None
+
+    if loop is None:
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(
+            SocialMediaAdapter.close_session(), loop
+        ).result(timeout=5)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
@@ -1,86 +1,260 @@
+import asyncio
 import json
-import time
+import logging
+import os
+from collections import defaultdict
 
-from app.workers.celery_app import celery_app
-from app.cache.redis_client import redis_client
-from app.cache.cache_utils import make_cache_key
-from app.analytics.sentiment import analyze_sentiments
-from app.analytics.words import extract_word_frequencies
-from app.metrics.metrics import incr
+import msgpack
+import orjson
+import redis
+
+from app.workers.celery_app import celery_app, run_async
+from app.adapters.factory import get_adapter
+from app.cache.redis_client import async_redis_client, async_redis_raw_client
+from app.cache.cache_utils import encode_result, make_cache_key
+from app.analytics.combined import analyze_topics
+
+logger = logging.getLogger(__name__)
 
 BATCH_QUEUE_KEY = "analysis_batch_queue"
 BATCH_SIZE = 5
+# A single task drains up to this many queued entries at once
+MAX_BATCH_SIZE = 64
 CACHE_TTL_SECONDS = 3600
+# How long an idle batch task waits on an empty queue before giving up
+POP_TIMEOUT_SECONDS = 1.0
 
+# Cleared by pop_batch_items() if the server predates BLMPOP (Redis < 7)
+_blmpop_supported = True
 
-@celery_app.task
-def process_batch():
+_ADAPTER = None
+_ADAPTER_NAME = None
+
+# Mock post sentences, completed with the post index
+_MOCK_TEMPLATES = (
+    "{} is amazing for developers #",
+    "I am unsure about {} future #",
+    "{} is overhyped and risky #",
+)
+
+
+def get_cached_adapter():
+    """
+    Return the adapter shared by every batch in this worker process.
+
+    Created on first use so the factory lookup and adapter setup run once
+    per process rather than once per batch.
+    """
+    global _ADAPTER, _ADAPTER_NAME
+
+    if _ADAPTER is None:
+        # Prioritize SocialData.tools if key is present (cheaper/unofficial)
+        if os.getenv("SOCIALDATA_API_KEY"):
+            _ADAPTER = get_adapter('socialdata')
+            _ADAPTER_NAME = "SocialData"
+        else:
+            _ADAPTER = get_adapter('twitter')
+            _ADAPTER_NAME = "Twitter (Official)"
+
+    return _ADAPTER, _ADAPTER_NAME
+
+
+# Leading byte marking a msgpack-encoded queue entry; entries without it
+# are legacy JSON (always starting with "{")
+QUEUE_FORMAT_MSGPACK = b"\x01"
+
+
+def encode_queue_entry(entry):
+    """Serialize a batch queue entry for RPUSH."""
+    try:
+        return QUEUE_FORMAT_MSGPACK + msgpack.packb(entry, use_bin_type=True)
+    except (OverflowError, UnicodeEncodeError):
+        # msgpack integers are limited to 64 bits and strings must be valid
+        # UTF-8 (no lone surrogates); fall back to the ASCII-escaped JSON
+        # format, which decode_queue_entry() still accepts
+        return json.dumps(entry, separators=(",", ":")).encode()
+
+
+def decode_queue_entry(item):
+    """Deserialize a raw batch queue entry, accepting msgpack or legacy JSON."""
+    if item[:1] == QUEUE_FORMAT_MSGPACK:
+        return msgpack.unpackb(item[1:], raw=False)
+    # json, not orjson: orjson reads integers beyond 64 bits as floats,
+    # which would change the entry's cache key
+    return json.loads(item)
+
+
+async def pop_batch_items(count, timeout=POP_TIMEOUT_SECONDS):
+    """
+    Pop up to `count` raw (bytes) entries from the batch queue in one round-trip.
+
+    Uses BLMPOP on Redis 7+, waiting up to `timeout` seconds for work when
+    the queue is empty, and falls back to a non-blocking atomic
+    LRANGE + LTRIM transaction on older servers.
+    """
+    global _blmpop_supported
+
+    if _blmpop_supported:
+        try:
+            popped = await async_redis_raw_client.blmpop(
+                timeout, 1, BATCH_QUEUE_KEY, direction="LEFT", count=count
+            )
+            return popped[1] if popped else []
+        except redis.ResponseError as e:
+            if "unknown command" not in str(e).lower():
+                raise
+            # Don't retry BLMPOP (one wasted round-trip per batch) once the
+            # server has said it doesn't have it
+            _blmpop_supported = False
+
+    async with async_redis_raw_client.pipeline(transaction=True) as pipe:
+        pipe.lrange(BATCH_QUEUE_KEY, 0, count - 1)
+        pipe.ltrim(BATCH_QUEUE_KEY, count, -1)
+        items, _ = await pipe.execute()
+    return items
+
+
+def _decode_batch(items):
+    """
+    Decode popped queue entries into (cache key, topic) pairs, dropping (and
+    logging) malformed ones.
+
+    /analyze accepts any dict, so an entry may lack a usable topic or fail
+    to hash; checking each entry here keeps one bad entry from failing the
+    rest of the popped batch. Topics that decode but can't be encoded as
+    UTF-8 are kept: their results take the JSON fallback in encode_result(),
+    and run_batch() isolates result failures per topic.
+    """
     batch = []
+    for item in items:
+        try:
+            entry = decode_queue_entry(item)
+            topic = entry["payload"]["topic"]
+            key = make_cache_key(entry["payload"])
+        except Exception as e:
+            logger.warning("Dropping malformed batch entry %r: %r", item[:200], e)
+            continue
 
-    for _ in range(BATCH_SIZE):
-        item = redis_client.lpop(BATCH_QUEUE_KEY)
-        if not item:
-            break
-        batch.append(json.loads(item))
+        if not isinstance(topic, str):
+            logger.warning(
+                "Dropping batch entry %s with invalid topic %r",
+                entry.get("request_id"), topic,
+            )
+            continue
+
+        batch.append((key, topic))
+    return batch
+
+
+async def run_batch():
+    """
+    Drain one batch from the queue, analyze it and cache the results.
+
+    Shared by the Celery task below and the arq worker in arq_worker.py.
+    """
+    # Take whatever is queued (up to the cap) rather than exactly BATCH_SIZE,
+    # so a backlog is cleared in fewer, larger batches
+    items = await pop_batch_items(MAX_BATCH_SIZE)
+
+    if not items:
+        return "empty batch"
+
+    batch = _decode_batch(items)
 
     if not batch:
         return "empty batch"
 
-    incr("metrics:batches_processed")
-    incr("metrics:batch_size_total", len(batch))
+    # Record metrics and skip entries whose result was cached after they were
+    # queued, in a single round-trip
+    keys = [key for key, _ in batch]
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        pipe.incrby("metrics:batches_processed", 1)
+        pipe.incrby("metrics:batch_size_total", len(batch))
+        pipe.mget(keys)
+        _, _, cached = await pipe.execute()
 
-    for entry in batch:
-        payload = entry["payload"]
-        topic = payload["topic"]
+    # Group the remaining entries by topic so each topic is fetched and
+    # analyzed once
+    by_topic = defaultdict(list)
+    for (key, topic), hit in zip(batch, cached):
+        if hit is None:
+            by_topic[topic].append(key)
 
-        # Try to fetch real data
-        try:
-            import asyncio
-            import os
-            from app.adapters.factory import get_adapter
-            
-            # Prioritize SocialData.tools if key is present (cheaper/unofficial)
-            if os.getenv("SOCIALDATA_API_KEY"):
-                adapter = get_adapter('socialdata')
-                platform_name = "SocialData"
-            else:
-                adapter = get_adapter('twitter')
-                platform_name = "Twitter (Official)"
-            
-            # Fetch posts asynchronously
-            social_posts = asyncio.run(adapter.fetch_posts(topic, max_results=120))
-            
-            # Extract text from SocialPost objects
-            posts = [post.text for post in social_posts]
-            
-            if not posts:
-                raise Exception("No posts returned from adapter")
-
-            print(f"✅ Fetched {len(posts)} posts from {platform_name} adapter for topic: {topic}")
-        except Exception as e:
-            # Fallback to mock data if adapter fails
-            print(f"⚠️ Adapter ({platform_name if 'platform_name' in locals() else 'Unknown'}) failed: {e}")
-            posts = generate_mock_posts(topic, count=120)
+    if not by_topic:
+        return f"processed batch of {len(batch)}"
+
+    adapter, platform_name = get_cached_adapter()
+
+    # Fetch every topic concurrently
+    topics = list(by_topic)
+    post_lists = await _fetch_all(adapter, platform_name, topics, 120)
 
-        sentiment = analyze_sentiments(posts)
-        word_freq = extract_word_frequencies(posts)
+    # Score every topic's posts in one pass, then split per topic
+    analyses = analyze_topics(post_lists)
 
+    writes = {}
+
+    for topic, posts, analysis in zip(topics, post_lists, analyses):
         result = {
             "topic": topic,
             "total_posts": len(posts),
-            "sentiment": sentiment,
-            "top_words": word_freq,
+            "sentiment": analysis["sentiment"],
+            "top_words": analysis["top_words"],
         }
 
-        redis_client.setex(
-            make_cache_key(payload),
-            CACHE_TTL_SECONDS,
-            json.dumps(result),
-        )
+        try:
+            value = encode_result(result)
+        except Exception:
+            # Skip just this topic's keys; the rest of the batch still lands
+            logger.exception("Failed to encode result for topic %r", topic)
+            continue
+
+        for key in by_topic[topic]:
+            writes[key] = value
+
+    # Store every result in a single round-trip
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        for key, value in writes.items():
+            pipe.setex(key, CACHE_TTL_SECONDS, value)
+        await pipe.execute()
 
     return f"processed batch of {len(batch)}"
 
 
+@celery_app.task
+def process_batch():
+    return run_async(run_batch())
+
+
+async def _fetch_one(adapter, platform_name, topic, count):
+    """Fetch post texts for one topic, falling back to mock posts on failure."""
+    try:
+        columns = await adapter.fetch_posts_soa(
+            topic, max_results=count, fields=("text",)
+        )
+        posts = columns["text"]
+
+        if not posts:
+            raise Exception("No posts returned from adapter")
+
+        logger.info(
+            "Fetched %d posts from %s adapter for topic: %s",
+            len(posts), platform_name, topic,
+        )
+        return posts
+    except Exception as e:
+        # Fallback to mock data if adapter fails
+        logger.warning("Adapter (%s) failed: %s", platform_name, e)
+        return generate_mock_posts(topic, count=count)
+
+
+async def _fetch_all(adapter, platform_name, topics, count):
+    """Fetch post texts for all topics concurrently."""
+    return await asyncio.gather(
+        *(_fetch_one(adapter, platform_name, topic, count) for topic in topics)
+    )
+
+
 def generate_mock_posts(topic, count=100):
     """
     Generate mock posts for testing.
@@ -88,14 +262,8 @@ def generate_mock_posts(topic, count=100):
     In production, this is replaced by the adapter system.
     Use fetch_posts_from_adapter() for real data.
     """
-    return [
-        f"{topic} is amazing for developers #{i}"
-        if i % 3 == 0
-        else f"I am unsure about {topic} future #{i}"
-        if i % 3 == 1
-        else f"{topic} is overhyped and risky #{i}"
-        for i in range(count)
-    ]
+    prefixes = [template.format(topic) for template in _MOCK_TEMPLATES]
+    return [prefixes[i % 3] + str(i) for i in range(count)]
 
 
 async def fetch_posts_from_adapter(topic: str, count: int = 100, platform: str = "twitter"):
@@ -110,17 +278,15 @@ async def fetch_posts_from_adapter(topic: str, count: int = 100, platform: str =
     Returns:
         List of post texts
         
-    Example:
-        To switch to real Twitter data, replace generate_mock_posts() 
-        with this function in process_batch().
+    Note:
+        For one-off callers (scripts, notebooks). The batch worker fetches
+        through get_cached_adapter() and _fetch_one() instead; this helper
+        closes the shared HTTP session on return unless other code on the
+        same event loop is still using it.
     """
-    from app.adapters.factory import get_adapter
-    
-    # Create adapter instance
-    adapter = get_adapter(platform)
-    
-    # Fetch posts
-    posts = await adapter.fetch_posts(topic, max_results=count)
-    
-    # Extract text from posts
-    return [post.text for post in posts]
+    # Create adapter instance; the context closes the shared HTTP session on
+    # exit if nothing outside it has used the session
+    async with get_adapter(platform) as adapter:
+        # Fetch just the text column
+        columns = await adapter.fetch_posts_soa(topic, max_results=count, fields=("text",))
+    return columns["text"]
@@ -6,6 +6,7 @@ and analyze social media data.
 """
 
 import asyncio
+from app.adapters.base import SocialMediaAdapter
 from app.adapters.factory import get_adapter, AdapterFactory
 from app.analytics.sentiment import analyze_sentiments
 from app.analytics.words import extract_word_frequencies
@@ -176,12 +177,16 @@ async def main():
     print(f"Supported platforms: {', '.join(platforms)}\n")
     
     # Run examples
-    await example_basic_usage()
-    await example_sentiment_analysis()
-    await example_word_frequency()
-    await example_advanced_query()
-    await example_multi_topic()
-    await example_post_details()
+    try:
+        await example_basic_usage()
+        await example_sentiment_analysis()
+        await example_word_frequency()
+        await example_advanced_query()
+        await example_multi_topic()
+        await example_post_details()
+    finally:
+        # The adapters share one HTTP session per event loop
+        await SocialMediaAdapter.close_session()
     
     print("\n" + "=" * 60)
     print("✅ All examples completed!")
@@ -10,6 +10,7 @@ import os
 # Add project to path
 sys.path.insert(0, '/Users/nandana/newproj/async-social-analytics')
 
+from app.adapters.base import SocialMediaAdapter
 from app.adapters.factory import get_adapter
 
 
@@ -68,5 +69,13 @@ async def test_adapter():
     print()
 
 
+async def main():
+    try:
+        await test_adapter()
+    finally:
+        # The adapters share one HTTP session per event loop
+        await SocialMediaAdapter.close_session()
+
+
 if __name__ == "__main__":
-    asyncio.run(test_adapter())
+    asyncio.run(main())